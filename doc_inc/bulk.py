@@ -0,0 +1,73 @@
+"""
+Bulk helpers for Doc Inc Document Delivery System.
+Validates and hashes many users at once for signup batches, CSV/migration
+imports and rehash migrations.
+"""
+
+from doc_inc.user import User, _configured_hasher
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to per-user validation
+    np = None
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _validate_passwords_kernel(buf, offsets, out):
+        """Apply the User._validate_password rules to each buf[offsets[i]:offsets[i + 1]]."""
+        for i in prange(len(offsets) - 1):
+            start, end = offsets[i], offsets[i + 1]
+            if end - start < 8:
+                out[i] = False
+                continue
+            has_upper = has_digit = False
+            for j in range(start, end):
+                c = buf[j]
+                has_upper |= 0x41 <= c <= 0x5A
+                has_digit |= 0x30 <= c <= 0x39
+            out[i] = has_upper and has_digit
+
+
+def validate_passwords_batch(passwords):
+    """
+    Validate a sequence of passwords with the same rules as User._validate_password.
+    Returns a list of booleans, one per password.
+    Uses a parallel Numba kernel when numba is installed.
+    """
+    passwords = list(passwords)
+    if njit is None or not passwords:
+        return [User._validate_password(password) for password in passwords]
+
+    # UTF-32 gives one code point per element, so lengths match len(password).
+    # surrogatepass keeps lone surrogates (one element each) instead of raising,
+    # matching the fallback path, which accepts any str.
+    buf = np.frombuffer(''.join(passwords).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    offsets = np.zeros(len(passwords) + 1, dtype=np.int64)
+    np.cumsum([len(password) for password in passwords], out=offsets[1:])
+    out = np.empty(len(passwords), dtype=np.bool_)
+    _validate_passwords_kernel(buf, offsets, out)
+    return out.tolist()
+
+
+def validate_emails_batch(emails):
+    """
+    Validate a sequence of email addresses with the same rules as User._validate_email.
+    Returns a list of booleans, one per address.
+    """
+    # The str-method checks in _validate_email beat both google-re2 and a
+    # single-buffer regex scan here, so the batch is a plain loop over them.
+    validate = User._validate_email
+    return [validate(email) for email in emails]
+
+
+def hash_passwords_batch(passwords):
+    """
+    Hash a sequence of passwords the same way as User.hash_password.
+    Returns a list of stored-format hashes, one per password.
+    The algorithm is looked up once for the whole batch.
+    """
+    tag, hasher = _configured_hasher()
+    return [tag + hasher(password.encode()).digest() for password in passwords]
@@ -0,0 +1,48 @@
+"""
+Notification module for Doc Inc Document Delivery System.
+Delivers user emails without holding up the request that triggered them.
+"""
+
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedNotificationService:
+    """
+    Wraps a notification service so send_email returns immediately.
+    Emails are queued and handed to the wrapped service's send_email,
+    in order, by a single background worker thread.
+    The worker is a daemon thread, so emails still queued when the
+    interpreter exits are dropped unless the caller calls join() first.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._drain, name="doc-inc-notify", daemon=True)
+        self._worker.start()
+
+    def enqueue(self, to_address, subject, body):
+        """Queue an email for delivery. Always returns True."""
+        self._queue.put_nowait((to_address, subject, body))
+        return True
+
+    # User and other callers only know send_email; for this service it just queues.
+    send_email = enqueue
+
+    def join(self):
+        """Block until every queued email has been passed to the wrapped service."""
+        self._queue.join()
+
+    def _drain(self):
+        while True:
+            to_address, subject, body = self._queue.get()
+            try:
+                self.service.send_email(to_address, subject, body)
+            except Exception:
+                logger.exception("Failed to send email to %s", to_address)
+            finally:
+                self._queue.task_done()
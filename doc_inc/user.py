@@ -3,45 +3,194 @@ User module for Doc Inc Document Delivery System.
 Handles user authentication, password management, and email updates.
 """
 
-import hashlib
-import re
+import logging
+import string
+
+from hashlib import algorithms_guaranteed
+# Imported by name so hot paths do a single global lookup. When CPython is
+# linked against OpenSSL, sha256 is the EVP-backed constructor, which uses
+# the SHA extensions (SHA-NI) on CPUs that have them.
+from hashlib import sha256 as _sha256
+from hmac import compare_digest as _compare_digest
+
+logger = logging.getLogger(__name__)
+
+# sha256 is guaranteed on every CPython build; fail loudly rather than mis-hash if not.
+if 'sha256' not in algorithms_guaranteed:
+    raise ImportError("hashlib does not guarantee sha256 on this Python build")
+
+# 'openssl' when sha256 is _hashlib.openssl_sha256, else CPython's builtin fallback.
+SHA256_BACKEND = 'openssl' if _sha256.__module__ == '_hashlib' else 'builtin'
+logger.info("Password hashing uses the %s SHA-256 backend", SHA256_BACKEND)
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # blake3 is optional; only needed when HASH_ALGO = 'blake3'
+    _blake3 = None
+
+# Algorithm used for new password hashes ('sha256' or 'blake3').
+# Stored hashes are a tag followed by the 32-byte raw digest so login picks
+# the right algorithm: untagged or b's256$' is SHA-256, b'b3$' is BLAKE3.
+# The text form (see User.password_hash_hex) is the same tag followed by hex.
+HASH_ALGO = 'sha256'
+_DIGEST_SIZE = 32
+_HASH_ALGOS = {'sha256': (b'', _sha256), 'blake3': (b'b3$', _blake3)}
+_HASHERS_BY_TAG = {b'': _sha256, b's256$': _sha256, b'b3$': _blake3}
+
+# Confirmation email sent after a successful password reset.
+_RESET_SUBJECT = "Password Reset Confirmation"
+_RESET_BODY = "Your password for Doc Inc has been successfully reset."
+
+# Character classes a password must draw from (ASCII only, like [A-Z] / [0-9]).
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+
+# Characters allowed on each side of the '@' in an email address.
+_LOCAL_OK = frozenset(string.ascii_letters + string.digits + '._%+-')
+_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + '.-')
+
+
+def _configured_hasher():
+    """Return (tag, constructor) for HASH_ALGO."""
+    tag, hasher = _HASH_ALGOS.get(HASH_ALGO, (b'', None))
+    if hasher is None:
+        raise ValueError(f"HASH_ALGO {HASH_ALGO!r} is not supported or not installed")
+    return tag, hasher
+
+
+def _noop(*args):
+    """Stand-in for send_email when a user has no notification service."""
+
+
+def _parse_password_hash(password_hash):
+    """
+    Split a stored hash into (stored bytes, constructor, raw digest).
+    Accepts the bytes form or, for older records, the hex text form.
+    Text that is not hex (e.g. a disabled-account sentinel) is kept as-is and,
+    like an empty hash, never matches on login.
+    """
+    if not password_hash:
+        return password_hash, _sha256, b''  # an empty digest never matches on login
+    if isinstance(password_hash, str):
+        tag, sep, hex_digest = password_hash.rpartition('$')
+        try:
+            raw_digest = bytes.fromhex(hex_digest)
+        except ValueError:
+            return password_hash, _sha256, b''
+        password_hash = (tag + sep).encode() + raw_digest
+    tag, digest = password_hash[:-_DIGEST_SIZE], password_hash[-_DIGEST_SIZE:]
+    hasher = _HASHERS_BY_TAG.get(tag)
+    if hasher is None or len(digest) != _DIGEST_SIZE:
+        raise ValueError(f"password hash with tag {tag!r} and {len(digest)}-byte digest is not supported")
+    return password_hash, hasher, digest
 
 
 class User:
     """Base user class for the Doc Inc system."""
 
+    __slots__ = (
+        'user_id', 'username', 'email', '_password_hash', '_password_hash_bytes', '_hasher',
+        'is_logged_in', '_lock_state', '_notification_service', '_notify',
+    )
+
+    _LOCK_THRESHOLD = 3  # failed login attempts before the account locks
+    # _lock_state packs the failed-attempt count (low bits) with this lock flag.
+    _LOCKED_BIT = 1 << 8
+
     def __init__(self, user_id, username, email, password_hash, notification_service=None):
         self.user_id = user_id
         self.username = username
         self.email = email
         self.password_hash = password_hash
         self.is_logged_in = False
-        self.failed_login_attempts = 0
-        self.is_locked = False
+        self._lock_state = 0
         self.notification_service = notification_service
 
+    @property
+    def notification_service(self):
+        """Service used to send user emails, or None."""
+        return self._notification_service
+
+    @notification_service.setter
+    def notification_service(self, service):
+        # Bind send_email once so reset_password calls it without a branch or lookup.
+        self._notification_service = service
+        self._notify = service.send_email if service else _noop
+
+    @property
+    def password_hash(self):
+        """Stored password hash: algorithm tag + 32-byte raw digest, or None."""
+        return self._password_hash
+
+    @password_hash.setter
+    def password_hash(self, password_hash):
+        # Stored as bytes; the raw digest and its algorithm are split out once here
+        # so login never re-parses, and replacing the hash changes what logs in.
+        self._password_hash, self._hasher, self._password_hash_bytes = _parse_password_hash(password_hash)
+
+    @property
+    def password_hash_hex(self):
+        """Text form of password_hash for storage; User() accepts it back."""
+        stored = self._password_hash
+        if not stored or isinstance(stored, str):
+            return stored  # empty, or a non-hex sentinel kept from the stored row
+        tag = stored[:-_DIGEST_SIZE].decode()
+        return tag + stored[-_DIGEST_SIZE:].hex()
+
+    @property
+    def failed_login_attempts(self):
+        """Number of consecutive failed logins since the last success or reset."""
+        return self._lock_state & (User._LOCKED_BIT - 1)
+
+    @failed_login_attempts.setter
+    def failed_login_attempts(self, value):
+        if not 0 <= value < User._LOCKED_BIT:
+            raise ValueError(f"failed_login_attempts must be between 0 and {User._LOCKED_BIT - 1}")
+        self._lock_state = (self._lock_state & User._LOCKED_BIT) | value
+
+    @property
+    def is_locked(self):
+        """True once the account has hit _LOCK_THRESHOLD failed logins."""
+        return bool(self._lock_state & User._LOCKED_BIT)
+
+    @is_locked.setter
+    def is_locked(self, value):
+        if value:
+            self._lock_state |= User._LOCKED_BIT
+        else:
+            self._lock_state &= ~User._LOCKED_BIT
+
     @staticmethod
     def hash_password(password):
-        """Hash a plaintext password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """
+        Hash a plaintext password using HASH_ALGO (SHA-256 by default).
+        Returns the stored bytes form: algorithm tag + 32-byte raw digest.
+        """
+        tag, hasher = _configured_hasher()
+        return tag + hasher(password.encode()).digest()
 
     def login(self, username, password):
         """
         Authenticate user with username and password.
-        Locks account after 3 failed attempts.
+        Locks account after _LOCK_THRESHOLD (3) failed attempts.
         Returns True if login successful, False otherwise.
         """
-        if self.is_locked:
+        state = self._lock_state
+        if state & User._LOCKED_BIT:
             return False
 
-        if username == self.username and User.hash_password(password) == self.password_hash:
+        if username == self.username and _compare_digest(
+                self._hasher(password.encode()).digest(), self._password_hash_bytes):
             self.is_logged_in = True
-            self.failed_login_attempts = 0
+            self._lock_state = 0
             return True
         else:
-            self.failed_login_attempts += 1
-            if self.failed_login_attempts >= 3:
-                self.is_locked = True
+            # Cap the count so it can never carry into _LOCKED_BIT.
+            if state < User._LOCKED_BIT - 1:
+                state += 1
+            if state >= User._LOCK_THRESHOLD:
+                state |= User._LOCKED_BIT
+            self._lock_state = state
             return False
 
     def logout(self):
@@ -52,22 +201,21 @@ class User:
         """
         Reset user password and send notification email.
         Password must be at least 8 characters with one uppercase and one digit.
-        Uses notification_service to send confirmation email.
+        Uses notification_service to send confirmation email; wrap it in
+        doc_inc.notification.QueuedNotificationService to avoid waiting on delivery.
         """
         if not self._validate_password(new_password):
             return False
 
-        self.password_hash = User.hash_password(new_password)
-        self.is_locked = False
-        self.failed_login_attempts = 0
+        tag, hasher = _configured_hasher()
+        digest = hasher(new_password.encode()).digest()
+        self._hasher = hasher
+        self._password_hash_bytes = digest
+        self._password_hash = tag + digest
+        self._lock_state = 0
 
         # Send notification - this is what we MOCK in testing
-        if self.notification_service:
-            self.notification_service.send_email(
-                self.email,
-                "Password Reset Confirmation",
-                f"Your password for Doc Inc has been successfully reset."
-            )
+        self._notify(self.email, _RESET_SUBJECT, _RESET_BODY)
 
         return True
 
@@ -83,14 +231,28 @@ class User:
         """Password must be 8+ chars, with at least one uppercase and one digit."""
         if len(password) < 8:
             return False
-        if not re.search(r'[A-Z]', password):
+        if _UPPERCASE.isdisjoint(password):
             return False
-        if not re.search(r'[0-9]', password):
+        if _DIGITS.isdisjoint(password):
             return False
         return True
 
     @staticmethod
     def _validate_email(email):
-        """Basic email validation."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        """
+        Basic email validation.
+        Accepts local@domain.tld where the TLD is 2+ ASCII letters.
+        """
+        at = email.rfind('@')
+        if at <= 0:
+            return False
+        local, domain = email[:at], email[at + 1:]
+        if not _LOCAL_OK.issuperset(local):
+            return False
+        dot = domain.rfind('.')
+        if dot < 1:
+            return False
+        tld = domain[dot + 1:]
+        if len(tld) < 2 or not (tld.isascii() and tld.isalpha()):
+            return False
+        return _DOMAIN_OK.issuperset(domain)
@@ -0,0 +1,150 @@
+"""
+Unit Tests for Doc Inc Bulk Module.
+Tests that batch helpers give the same answers as the per-user methods.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path so we can import doc_inc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from doc_inc import bulk
+from doc_inc.bulk import hash_passwords_batch, validate_emails_batch, validate_passwords_batch
+from doc_inc.user import User
+
+
+class TestValidatePasswordsBatch(unittest.TestCase):
+    """
+    Batch password validation must match User._validate_password
+    for every entry, whichever backend is in use.
+    """
+
+    PASSWORDS = [
+        "SecurePass1",
+        "weak",
+        "securepass1",
+        "SECUREPASS",
+        "ÀÀÀÀÀÀA1",
+        "ÀÀÀÀA1",
+        "",
+    ]
+
+    def test_batch_matches_single_validation(self):
+        """Each batch result equals the single-password result."""
+        expected = [User._validate_password(p) for p in self.PASSWORDS]
+        self.assertEqual(validate_passwords_batch(self.PASSWORDS), expected)
+
+    def test_empty_batch(self):
+        """An empty batch returns an empty list."""
+        self.assertEqual(validate_passwords_batch([]), [])
+
+    def test_lone_surrogate_accepted_like_single_validation(self):
+        """Lone surrogates are validated like any other character, not rejected with an error."""
+        passwords = ["Secure\ud800Pass1", "\udc00\udc00\udc00\udc00\udc00A1"]
+        self.assertEqual(validate_passwords_batch(passwords), [True, False])
+
+
+@unittest.skipUnless(bulk.njit, "numba is not installed")
+class TestValidatePasswordsKernel(unittest.TestCase):
+    """
+    Checks the Numba kernel and the UTF-32 packing against fixed answers,
+    since without numba the batch tests only exercise the fallback loop.
+    """
+
+    PASSWORDS = [
+        ("SecurePass1", True),
+        ("Abcdefg1", True),        # exactly 8 characters
+        ("Abcdef1", False),        # 7 characters
+        ("ÀÀÀÀÀÀA1", True),        # 8 code points, more than 8 UTF-8 bytes
+        ("ÀÀÀÀA1", False),         # 6 code points, 10 UTF-8 bytes
+        ("Àbcdefg1", False),       # 'À' is not an ASCII uppercase letter
+        ("Abcdefg\u0661", False),  # Arabic-Indic digit is not 0-9
+        ("securepass1", False),
+        ("SECUREPASS", False),
+        ("", False),
+    ]
+
+    def test_kernel_on_packed_buffer(self):
+        """The kernel gives the expected result for each slice of the buffer."""
+        np = bulk.np
+        passwords = [p for p, _ in self.PASSWORDS]
+        buf = np.array([ord(c) for c in "".join(passwords)], dtype=np.uint32)
+        offsets = np.array([0] + [len(p) for p in passwords], dtype=np.int64).cumsum()
+        out = np.empty(len(passwords), dtype=np.bool_)
+
+        bulk._validate_passwords_kernel(buf, offsets, out)
+        self.assertEqual(out.tolist(), [ok for _, ok in self.PASSWORDS])
+
+    def test_batch_uses_expected_results(self):
+        """validate_passwords_batch returns the fixed expected answers."""
+        passwords = [p for p, _ in self.PASSWORDS]
+        self.assertEqual(validate_passwords_batch(passwords), [ok for _, ok in self.PASSWORDS])
+
+
+class TestValidateEmailsBatch(unittest.TestCase):
+    """
+    Batch email validation must match User._validate_email
+    for every entry, whichever backend is in use.
+    """
+
+    EMAILS = [
+        "jsmith@docincorp.com",
+        "first.last+tag@mail.docincorp.co",
+        "no-at-sign.com",
+        "@docincorp.com",
+        "jsmith@docincorp",
+        "jsmith@docincorp.c",
+        "j smith@docincorp.com",
+        "",
+    ]
+
+    def test_batch_matches_single_validation(self):
+        """Each batch result equals the single-address result."""
+        expected = [User._validate_email(e) for e in self.EMAILS]
+        self.assertEqual(validate_emails_batch(self.EMAILS), expected)
+
+
+class TestValidateEmailsFixedResults(unittest.TestCase):
+    """
+    Checks batch email validation against fixed answers rather than
+    against User._validate_email itself.
+    """
+
+    EMAILS = [
+        ("jsmith@docincorp.com", True),
+        ("first.last+tag@mail.doc-inc.co", True),
+        ("j%s_1@docincorp.io", True),
+        ("jsmith@docincorp.com\n", False),   # trailing newline
+        ("jsmith@docincorp", False),
+        ("jsmith@.com", False),
+        ("jsmith@docincorp.c", False),
+        ("jsmith@docincorp.c0m", False),
+        ("a@b@docincorp.com", False),
+        ("j smith@docincorp.com", False),
+        ("jsmith@docincorp.cóm", False),     # TLD must be ASCII letters
+        ("\udcff@docincorp.co", False),      # lone surrogate, not UTF-8 encodable
+        ("jsmith@docincorp.co\udcff", False),
+        ("", False),
+    ]
+
+    def test_batch_matches_expected_results(self):
+        """Batch validation returns the fixed expected answers."""
+        emails = [e for e, _ in self.EMAILS]
+        self.assertEqual(validate_emails_batch(emails), [ok for _, ok in self.EMAILS])
+
+
+class TestHashPasswordsBatch(unittest.TestCase):
+    """
+    Batch hashing must produce the same stored hashes as User.hash_password.
+    """
+
+    def test_batch_matches_single_hash(self):
+        """Each batch hash equals the single-password hash."""
+        passwords = ["SecurePass1", "OldPassword1", "ÀÀÀÀÀÀA1", ""]
+        expected = [User.hash_password(p) for p in passwords]
+        self.assertEqual(hash_passwords_batch(passwords), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Unit Tests for Doc Inc Notification Module.
+Tests that queued notifications are delivered off the caller's thread.
+"""
+import threading
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add parent directory to path so we can import doc_inc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from doc_inc.notification import QueuedNotificationService
+from doc_inc.user import User
+
+
+class TestQueuedNotificationService(unittest.TestCase):
+    """
+    Business logic: a password reset must not wait on email delivery,
+    but the confirmation email must still reach the real service.
+    """
+
+    def setUp(self):
+        """Create a user whose notifications go through the queue."""
+        self.mock_service = MagicMock()
+        self.queued_service = QueuedNotificationService(self.mock_service)
+        self.user = User(
+            user_id=7,
+            username="qng",
+            email="qng@docincorp.com",
+            password_hash=User.hash_password("OldPassword1"),
+            notification_service=self.queued_service
+        )
+
+    def test_reset_email_delivered_by_worker(self):
+        """The confirmation email reaches the wrapped service."""
+        self.assertTrue(self.user.reset_password("NewSecure1"))
+        self.queued_service.join()
+
+        self.mock_service.send_email.assert_called_once_with(
+            "qng@docincorp.com",
+            "Password Reset Confirmation",
+            "Your password for Doc Inc has been successfully reset."
+        )
+
+    def test_reset_does_not_wait_for_slow_service(self):
+        """reset_password returns while the wrapped service is still blocked."""
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_send_email(*args):
+            started.set()
+            release.wait(5)
+            finished.set()
+
+        self.mock_service.send_email.side_effect = slow_send_email
+
+        self.assertTrue(self.user.reset_password("NewSecure1"))
+        # Waiting for the worker to pick the email up proves delivery runs off this thread.
+        self.assertTrue(started.wait(5))
+        self.assertFalse(release.is_set())
+        self.assertFalse(finished.is_set())
+        self.assertTrue(self.user.login("qng", "NewSecure1"))
+
+        release.set()
+        self.queued_service.join()
+        self.assertTrue(finished.is_set())
+        self.mock_service.send_email.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ Test 1: Regular unit test - tests login authentication and account locking
 Test 2: Uses a STUB - replaces NotificationService with a simple stand-in
 Test 3: Uses a MOCK - verifies NotificationService.send_email was called correctly
 """
+import hashlib
 import unittest
 from unittest.mock import MagicMock, patch, call
 import sys
@@ -14,6 +15,7 @@ import os
 # Add parent directory to path so we can import doc_inc
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from doc_inc import user as user_module
 from doc_inc.user import User
 
 
@@ -72,6 +74,19 @@ class TestUserLogin(unittest.TestCase):
         self.assertFalse(self.user.is_logged_in)
         self.assertEqual(self.user.failed_login_attempts, 1)
 
+    def test_login_fails_without_stored_hash(self):
+        """A user created without a password hash cannot log in."""
+        user = User(user_id=4, username="nopass", email="nopass@docincorp.com", password_hash=None)
+        self.assertFalse(user.login("nopass", "SecurePass1"))
+        self.assertEqual(user.failed_login_attempts, 1)
+
+    def test_assigning_password_hash_changes_login(self):
+        """Replacing password_hash makes only the new password authenticate."""
+        self.user.password_hash = User.hash_password("OtherPass1")
+
+        self.assertFalse(self.user.login("jsmith", "SecurePass1"))
+        self.assertTrue(self.user.login("jsmith", "OtherPass1"))
+
     def test_account_locks_after_three_failed_attempts(self):
         """Account locks after 3 consecutive failed login attempts (security)."""
         self.user.login("jsmith", "Wrong1")
@@ -83,6 +98,47 @@ class TestUserLogin(unittest.TestCase):
         result = self.user.login("jsmith", "SecurePass1")
         self.assertFalse(result)
 
+    def test_setting_is_locked_keeps_attempt_count(self):
+        """is_locked can be set and cleared without touching the attempt count."""
+        self.user.login("jsmith", "Wrong1")
+        self.user.is_locked = True
+        self.assertTrue(self.user.is_locked)
+        self.assertEqual(self.user.failed_login_attempts, 1)
+        self.assertFalse(self.user.login("jsmith", "SecurePass1"))
+
+        self.user.is_locked = False
+        self.assertFalse(self.user.is_locked)
+        self.assertEqual(self.user.failed_login_attempts, 1)
+        self.assertTrue(self.user.login("jsmith", "SecurePass1"))
+
+    def test_setting_failed_login_attempts_keeps_lock(self):
+        """failed_login_attempts can be set without changing the lock flag."""
+        self.user.failed_login_attempts = 2
+        self.assertEqual(self.user.failed_login_attempts, 2)
+        self.assertFalse(self.user.is_locked)
+        self.user.login("jsmith", "Wrong1")
+        self.assertTrue(self.user.is_locked)
+
+        self.user.failed_login_attempts = 0
+        self.assertEqual(self.user.failed_login_attempts, 0)
+        self.assertTrue(self.user.is_locked)
+
+    def test_failed_login_at_max_count_does_not_overflow(self):
+        """A failed login at the maximum count locks without wrapping the count."""
+        self.user.failed_login_attempts = 255
+        self.assertFalse(self.user.login("jsmith", "Wrong1"))
+
+        self.assertTrue(self.user.is_locked)
+        self.assertEqual(self.user.failed_login_attempts, 255)
+
+    def test_out_of_range_failed_login_attempts_rejected(self):
+        """Counts that would overflow into the lock flag are rejected."""
+        for value in (-1, 256, 300):
+            with self.assertRaises(ValueError):
+                self.user.failed_login_attempts = value
+        self.assertFalse(self.user.is_locked)
+        self.assertEqual(self.user.failed_login_attempts, 0)
+
 
 class TestUserPasswordResetWithStub(unittest.TestCase):
     """
@@ -134,6 +190,23 @@ class TestUserPasswordResetWithStub(unittest.TestCase):
         self.assertFalse(self.user.is_locked)
         self.assertEqual(self.user.failed_login_attempts, 0)
 
+    def test_login_uses_new_password_after_reset(self):
+        """After a reset, only the new password authenticates."""
+        self.assertTrue(self.user.login("mgarcia", "OldPassword1"))
+        self.user.reset_password("NewSecure1")
+
+        self.assertFalse(self.user.login("mgarcia", "OldPassword1"))
+        self.assertTrue(self.user.login("mgarcia", "NewSecure1"))
+
+    def test_replaced_notification_service_receives_email(self):
+        """Swapping notification_service after creation redirects the reset email."""
+        new_stub = StubNotificationService()
+        self.user.notification_service = new_stub
+        self.user.reset_password("NewSecure1")
+
+        self.assertEqual(len(self.stub_service.emails_sent), 0)
+        self.assertEqual(len(new_stub.emails_sent), 1)
+
     def test_weak_password_rejected_no_email_sent(self):
         """Weak password is rejected and NO confirmation email is sent."""
         result = self.user.reset_password("weak")
@@ -194,5 +267,101 @@ class TestUserPasswordResetWithMock(unittest.TestCase):
         )
 
 
+class TestUserValidation(unittest.TestCase):
+    """
+    Unit Tests for password and email validation rules.
+    Business logic: passwords need 8+ chars, one uppercase and one digit.
+    """
+
+    def test_valid_password_accepted(self):
+        """Password meeting all rules is accepted."""
+        self.assertTrue(User._validate_password("SecurePass1"))
+        self.assertTrue(User._validate_password("1securepasS"))
+
+    def test_password_missing_uppercase_or_digit_rejected(self):
+        """Password without an uppercase letter or a digit is rejected."""
+        self.assertFalse(User._validate_password("securepass1"))
+        self.assertFalse(User._validate_password("SecurePass"))
+
+    def test_valid_email_accepted(self):
+        """Well-formed addresses are accepted."""
+        self.assertTrue(User._validate_email("jsmith@docincorp.com"))
+        self.assertTrue(User._validate_email("first.last+tag@mail.doc-inc.co"))
+
+    def test_invalid_email_rejected(self):
+        """Malformed addresses are rejected."""
+        for email in ["jsmith", "@docincorp.com", "jsmith@", "jsmith@docincorp",
+                      "jsmith@.com", "jsmith@docincorp.c", "jsmith@docincorp.c0m",
+                      "j smith@docincorp.com", "a@b@docincorp.com", "jsmith@docincorp.com\n"]:
+            self.assertFalse(User._validate_email(email), email)
+
+
+class TestSha256Backend(unittest.TestCase):
+    """
+    Unit Tests for SHA-256 backend detection.
+    Deployers read SHA256_BACKEND to confirm the OpenSSL (SHA-NI capable) path is used.
+    """
+
+    def test_backend_matches_hashlib_constructor(self):
+        """SHA256_BACKEND is 'openssl' exactly when hashlib.sha256 is _hashlib.openssl_sha256."""
+        try:
+            import _hashlib
+        except ImportError:
+            expected = 'builtin'
+        else:
+            expected = 'openssl' if hashlib.sha256 is _hashlib.openssl_sha256 else 'builtin'
+        self.assertEqual(user_module.SHA256_BACKEND, expected)
+        self.assertIs(user_module._sha256, hashlib.sha256)
+
+
+class TestUserHashAlgorithms(unittest.TestCase):
+    """
+    Unit Tests for tagged password hashes.
+    Business logic: stored hashes record their algorithm so accounts keep
+    working while HASH_ALGO changes for new passwords.
+    """
+
+    def test_tagged_sha256_hash_logs_in(self):
+        """A hash stored with the 's256$' tag verifies like an untagged one."""
+        user = User(5, "tagged", "tagged@docincorp.com", b"s256$" + User.hash_password("SecurePass1"))
+        self.assertTrue(user.login("tagged", "SecurePass1"))
+
+    def test_non_hex_text_hash_loads_but_never_logs_in(self):
+        """A non-hex stored value (e.g. a disabled-account sentinel) loads and cannot log in."""
+        for sentinel in ("!", "*disabled*", "s256$not-hex"):
+            user = User(5, "locked", "locked@docincorp.com", sentinel)
+            self.assertEqual(user.password_hash, sentinel)
+            self.assertEqual(user.password_hash_hex, sentinel)
+            self.assertFalse(user.login("locked", "SecurePass1"))
+
+    def test_hex_text_hash_accepted(self):
+        """Older hex-text hashes are converted to bytes and still log in."""
+        hex_hash = hashlib.sha256(b"SecurePass1").hexdigest()
+        user = User(5, "legacy", "legacy@docincorp.com", hex_hash)
+
+        self.assertEqual(user.password_hash, User.hash_password("SecurePass1"))
+        self.assertEqual(user.password_hash_hex, hex_hash)
+        self.assertTrue(user.login("legacy", "SecurePass1"))
+
+    def test_unsupported_hash_algo_rejected(self):
+        """An unknown HASH_ALGO raises instead of silently using SHA-256."""
+        with patch('doc_inc.user.HASH_ALGO', 'md5'):
+            with self.assertRaises(ValueError):
+                User.hash_password("SecurePass1")
+
+    @unittest.skipUnless(user_module._blake3, "blake3 is not installed")
+    def test_blake3_reset_and_login(self):
+        """With HASH_ALGO = 'blake3', reset stores a 'b3$' hash that logs in."""
+        user = User(6, "b3user", "b3user@docincorp.com", User.hash_password("OldPassword1"))
+        with patch('doc_inc.user.HASH_ALGO', 'blake3'):
+            self.assertTrue(user.reset_password("NewSecure1"))
+        self.assertTrue(user.password_hash.startswith(b"b3$"))
+        self.assertTrue(user.login("b3user", "NewSecure1"))
+
+        for stored in (user.password_hash, user.password_hash_hex):
+            restored = User(6, "b3user", "b3user@docincorp.com", stored)
+            self.assertTrue(restored.login("b3user", "NewSecure1"))
+
+
 if __name__ == '__main__':
     unittest.main()